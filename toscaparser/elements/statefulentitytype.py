@@ -38,11 +38,11 @@ class StatefulEntityType(EntityType):
             if entitytype.startswith(self.TOSCA + ":"):
                 entitytype = entitytype[(len(self.TOSCA) + 1):]
                 entire_entitytype = prefix + entitytype
-            if not entitytype.startswith(self.TOSCA):
+            elif not entitytype.startswith(self.TOSCA):
                 entire_entitytype = prefix + entitytype
-            if custom_def and entitytype in list(custom_def.keys()):
+            if custom_def and entitytype in custom_def:
                 self.defs = custom_def[entitytype]
-            elif entire_entitytype in list(self.TOSCA_DEF.keys()):
+            elif entire_entitytype in self.TOSCA_DEF:
                 self.defs = self.TOSCA_DEF[entire_entitytype]
                 entitytype = entire_entitytype
             else:
@@ -181,7 +181,8 @@ class GetAttribute(Function):
                         value_type = attr.schema['entry_schema']['type']
                     elif value_type == "map":
                         value_type = attr.schema['entry_schema']['type']
-                    elif value_type in Schema.PROPERTY_TYPES:
+                    elif (isinstance(value_type, str) and
+                          value_type in Schema.PROPERTY_TYPES_SET):
                         ExceptionCollector.appendException(
                             ValueError(_('Illegal arguments for function'
                                          ' "{0}". Unexpected attribute/'
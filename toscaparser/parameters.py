@@ -25,6 +25,32 @@ from toscaparser.utils.gettextutils import _
 
 log = logging.getLogger('tosca')
 
+try:
+    from functools import cached_property
+except ImportError:
+    # Python < 3.8
+    class cached_property(object):
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
+# Builders for Output.values, keyed by the exact type of the output value.
+_VALUE_DISPATCH = {
+    GetAttribute: lambda v: dict(node=v.node_template_name,
+                                 attribute=v.attribute_name),
+    GetProperty: lambda v: dict(node=v.node_template_name,
+                                property=v.property_name),
+    str: lambda v: dict(value=v),
+}
+
 
 class Input(object):
 
@@ -33,58 +59,37 @@ class Input(object):
         ('type', 'description', 'default',
         'constraints', 'required', 'status',
         'entry_schema', 'title', 'hint', 'uitype', 'ui')
+    INPUTFIELD_SET = frozenset(INPUTFIELD)
+
+    __slots__ = ('name', 'schema', 'type', 'required', 'description',
+                 'default', 'status', 'title', 'hint', 'hidden', 'ui',
+                 'uitype', '_datatype', '_needs_schema')
 
     def __init__(self, name, schema_dict):
         self.name = name
-        self.schema = Schema(name, schema_dict)
+        self.schema = schema = Schema(name, schema_dict)
+        # The schema is fixed once parsed, so resolve its fields up front
+        # instead of going through Schema's properties on every access.
+        self.type = schema.type
+        self.required = schema.required
+        self.description = schema.description
+        self.default = schema.default
+        self.status = schema.status
+        self.title = schema.title
+        self.hint = schema.hint
+        self.hidden = schema.hidden
+        self.ui = schema.ui
+        self.uitype = schema.uitype
 
         self._validate_field()
         self.validate_type(self.type)
-
-    @property
-    def type(self):
-        return self.schema.type
-
-    @property
-    def required(self):
-        return self.schema.required
-
-    @property
-    def description(self):
-        return self.schema.description
-
-    @property
-    def default(self):
-        return self.schema.default
+        self._datatype = self._get_datatype()
+        self._needs_schema = self.type in (Schema.JSON, Schema.ENUM)
 
     @property
     def constraints(self):
         return self.schema.constraints
 
-    @property
-    def status(self):
-        return self.schema.status
-
-    @property
-    def title(self):
-        return self.schema.title
-
-    @property
-    def hint(self):
-        return self.schema.hint
-
-    @property
-    def hidden(self):
-        return self.schema.hidden
-
-    @property
-    def ui(self):
-        return self.schema.ui
-
-    @property
-    def uitype(self):
-        return self.schema.uitype
-
     def validate(self, value=None):
         validated_value = None
         if value is not None:
@@ -95,104 +100,119 @@ class Input(object):
         return validated_value
 
     def _validate_field(self):
+        what = 'Input "%s"' % self.name
+        fields = self.INPUTFIELD_SET
         for name in self.schema.schema:
-            if name not in self.INPUTFIELD:
+            if name not in fields:
                 ExceptionCollector.appendException(
-                    UnknownFieldError(what='Input "%s"' % self.name,
-                                      field=name))
+                    UnknownFieldError(what=what, field=name))
 
     def validate_type(self, input_type):
-        if input_type not in Schema.PROPERTY_TYPES:
+        if (not isinstance(input_type, str) or
+                input_type not in Schema.PROPERTY_TYPES_SET):
             ExceptionCollector.appendException(
                 ValueError(_('Invalid type "%s".') % type))
 
     # TODO(anyone) Need to test for any built-in datatype not just network
     # that is, tosca.datatypes.* and not assume tosca.datatypes.network.*
     # TODO(anyone) Add support for tosca.datatypes.Credential
-    def _validate_value(self, value):
+    def _get_datatype(self):
+        if not isinstance(self.type, str):
+            # validate_type() has already reported it
+            return None
         tosca = EntityType.TOSCA_DEF
-        datatype = None
-        if self.type in tosca:
-            datatype = tosca[self.type]
-        elif EntityType.DATATYPE_NETWORK_PREFIX + self.type in tosca:
-            datatype = tosca[EntityType.DATATYPE_NETWORK_PREFIX + self.type]
+        datatype = tosca.get(self.type)
+        if datatype is None:
+            datatype = tosca.get(
+                EntityType.DATATYPE_NETWORK_PREFIX + self.type)
+        return datatype
 
-        schema = self.schema if self.type in (Schema.JSON, Schema.ENUM) else None
-        return DataEntity.validate_datatype(self.type, value, schema, datatype)
+    def _validate_value(self, value):
+        schema = self.schema if self._needs_schema else None
+        return DataEntity.validate_datatype(self.type, value, schema,
+                                            self._datatype)
 
 
 class Output(object):
 
     OUTPUTFIELD = (DESCRIPTION, VALUE, DEFAULT, HIDDEN, TYPE, REQUIRED, CONSTRAINTS, UI_TYPE) = \
         ('description', 'value', 'default', 'hidden', 'type', 'required', 'constraints', 'uitype')
+    OUTPUTFIELD_SET = frozenset(OUTPUTFIELD)
 
     def __init__(self, name, attrs):
         self.name = name
         self.attrs = attrs
 
-    def _get_attr(self, name, defalut=None):
-        return self.attrs.get(name) if name in self.attrs else defalut
-
-    @property
+    def _get_attr(self, name, default=None):
+        if not isinstance(self.attrs, dict):
+            return default
+        return self.attrs.get(name, default)
+
+    # Each field is looked up in attrs once and then served from the
+    # instance dict. TopologyTemplate._process_intrinsic_functions() later
+    # replaces attrs[VALUE] with the resolved function and assigns value
+    # to match, so anything derived from value must not be cached.
+    @cached_property
     def description(self):
-        return self.attrs.get(self.DESCRIPTION)
+        return self._get_attr(self.DESCRIPTION)
 
-    @property
+    @cached_property
     def default(self):
         return self._get_attr(self.DEFAULT)
 
-    @property
+    @cached_property
     def hidden(self):
         return self._get_attr(self.HIDDEN, False)
 
-    @property
+    @cached_property
     def type(self):
         return self._get_attr(self.TYPE)
 
-    @property
+    @cached_property
     def uitype(self):
         return self._get_attr(self.UI_TYPE)
 
-    @property
+    @cached_property
     def required(self):
         return self._get_attr(self.REQUIRED, False)
 
-    @property
+    @cached_property
     def constraints(self):
         return self._get_attr(self.CONSTRAINTS)
 
-    @property
+    @cached_property
     def value(self):
-        return self.attrs.get(self.VALUE)
+        return self._get_attr(self.VALUE)
 
     @property
     def values(self):
-        if isinstance(self.value, GetAttribute):
-            node_template_name = self.value.node_template_name
-            attribute_name = self.value.attribute_name
-            return dict(node=node_template_name, attribute=attribute_name)
-        elif isinstance(self.value, GetProperty):
-            node_template_name = self.value.node_template_name
-            property_name = self.value.property_name
-            return dict(node=node_template_name, property=property_name)
-        elif isinstance(self.value, str):
-            return dict(value=self.value)
-        return dict()
+        value = self.value
+        build = _VALUE_DISPATCH.get(type(value))
+        if build is None:
+            # Subclasses of the dispatched types are rare; match them the
+            # slow way rather than missing them.
+            for value_type, builder in _VALUE_DISPATCH.items():
+                if isinstance(value, value_type):
+                    build = builder
+                    break
+            else:
+                return dict()
+        return build(value)
 
     def validate(self):
         self._validate_field()
 
     def _validate_field(self):
+        what = 'Output "%s"' % self.name
         if not isinstance(self.attrs, dict):
             ExceptionCollector.appendException(
-                MissingRequiredFieldError(what='Output "%s"' % self.name,
-                                          required=self.VALUE))
+                MissingRequiredFieldError(what=what, required=self.VALUE))
+            return
         if self.value is None:
             ExceptionCollector.appendException(
-                MissingRequiredFieldError(what='Output "%s"' % self.name,
-                                          required=self.VALUE))
+                MissingRequiredFieldError(what=what, required=self.VALUE))
+        fields = self.OUTPUTFIELD_SET
         for name in self.attrs:
-            if name not in self.OUTPUTFIELD:
+            if name not in fields:
                 ExceptionCollector.appendException(
-                    UnknownFieldError(what='Output "%s"' % self.name,
-                                      field=name))
+                    UnknownFieldError(what=what, field=name))
@@ -173,6 +173,12 @@ class PropertyTest(TestCase):
         self.assertIsNone(propertyInstance.validate())
         self.assertEqual("2015-04-01 21:59:43.10", propertyInstance.value)
 
+        # plain iso8601 timestamp with offset
+        propertyInstance = Property('test_property',
+                                    '2015-04-01T21:59:43.100-05:00',
+                                    test_property_schema)
+        self.assertIsNone(propertyInstance.validate())
+
         # date (00:00:00Z)
         propertyInstance = Property('test_property', '2015-04-01',
                                     test_property_schema)
@@ -189,6 +195,23 @@ class PropertyTest(TestCase):
         expected_message = (_('"%s" is not a valid timestamp.') % value)
         self.assertThat(str(error), matchers.StartsWith(expected_message))
 
+        # ISO week dates are rejected on every Python version, even where
+        # datetime.fromisoformat() would accept them
+        value = '2011-W01-2'
+        propertyInstance = Property('test_property', value,
+                                    test_property_schema)
+        error = self.assertRaises(ValueError, propertyInstance.validate)
+        expected_message = (_('"%s" is not a valid timestamp.') % value)
+        self.assertThat(str(error), matchers.StartsWith(expected_message))
+
+        # ISO shaped, but not a real date
+        value = '2015-02-30T02:59:43'
+        propertyInstance = Property('test_property', value,
+                                    test_property_schema)
+        error = self.assertRaises(ValueError, propertyInstance.validate)
+        expected_message = (_('"%s" is not a valid timestamp.') % value)
+        self.assertThat(str(error), matchers.StartsWith(expected_message))
+
     def test_required(self):
         test_property_schema = {'type': 'string'}
         propertyInstance = Property('test_property', 'Foo',
@@ -295,6 +295,27 @@ class ToscaTemplateValidationTest(TestCase):
         self.assertTrue(input2.required)
         toscaparser.utils.yamlparser.simple_parse(tpl_snippet3)['inputs']
 
+    def test_input_type_not_hashable(self):
+        input = Input('cpus', {'type': 'integer'})
+        for input_type in ({'a': 1}, ['integer']):
+            exception.ExceptionCollector.start()
+            input.validate_type(input_type)
+            exception.ExceptionCollector.stop()
+            errors = exception.ExceptionCollector.getExceptions()
+            self.assertEqual(1, len(errors))
+            self.assertIsInstance(errors[0], ValueError)
+            self.assertIn(_('Invalid type'), str(errors[0]))
+
+    def test_input_malformed_type(self):
+        for input_type in (None, 123, {'a': 1}):
+            exception.ExceptionCollector.start()
+            input = Input('cpus', {'type': input_type})
+            exception.ExceptionCollector.stop()
+            self.assertEqual(input_type, input.type)
+            errors = exception.ExceptionCollector.getExceptions()
+            self.assertEqual(1, len(errors))
+            self.assertIn(_('Invalid type'), str(errors[0]))
+
     def _imports_content_test(self, tpl_snippet, path, custom_type_def):
         imports = (toscaparser.utils.yamlparser.
                    simple_parse(tpl_snippet)['imports'])
@@ -525,6 +546,22 @@ heat-translator/master/translator/tests/data/custom_types/wordpress.yaml
                                'to verify valid values.'),
                              err.__str__())
 
+    def test_outputs_values_follow_value(self):
+        output = Output('server_address', {'value': 'abc'})
+        self.assertEqual({'value': 'abc'}, output.values)
+        output.value = 'def'
+        self.assertEqual({'value': 'def'}, output.values)
+
+    def test_outputs_not_a_map(self):
+        for attrs in ('abc', None):
+            exception.ExceptionCollector.start()
+            Output('server_address', attrs).validate()
+            exception.ExceptionCollector.stop()
+            self.assertEqual(
+                [_('MissingRequiredFieldError: Output "server_address" is '
+                   'missing required field "value".')],
+                exception.ExceptionCollector.getExceptionsReport(full=False))
+
     def _repo_content(self, path):
         repositories = path['repositories']
         reposit = []
@@ -10,8 +10,19 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
+import os
+import types
+
+import fixtures
+
+from toscaparser.common.exception import ExceptionCollector
+from toscaparser.common.exception import RangeValueError
 from toscaparser.tests.base import TestCase
+from toscaparser.utils.gettextutils import _
+import toscaparser.utils.hashutils
 import toscaparser.utils.urlutils
+import toscaparser.utils.validateutils
 import toscaparser.utils.yamlparser
 
 YAML_LOADER = toscaparser.utils.yamlparser.load_yaml
@@ -46,3 +57,214 @@ class UrlUtilsTest(TestCase):
             self.url_utils.join_url("http://github.com/proj1/scripts",
                                     "scripts/b.js"),
             "http://github.com/proj1/scripts/b.js")
+
+
+class FakeBlake3(object):
+    '''Stand-in for blake3.blake3, backed by BLAKE2b.'''
+
+    AUTO = -1
+    created = []
+
+    def __init__(self, max_threads=1):
+        self.max_threads = max_threads
+        self._hasher = hashlib.blake2b(digest_size=32)
+        FakeBlake3.created.append(self)
+
+    def update(self, data):
+        self._hasher.update(data)
+
+    def digest(self):
+        return self._hasher.digest()
+
+    def hexdigest(self):
+        return self._hasher.hexdigest()
+
+
+class HashUtilsTest(TestCase):
+
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'data')
+
+    def _expected(self, paths, new_hasher=hashlib.sha256):
+        hashes = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                hasher = new_hasher()
+                hasher.update(f.read())
+                hashes.append(hasher.digest())
+        hasher = new_hasher()
+        for val in sorted(hashes):
+            hasher.update(val)
+        return hasher.hexdigest()
+
+    def test_hash_all_with_import_set(self):
+        tpl = os.path.join(self.data_dir, 'test_custom_capabilty.yaml')
+        imports = {'custom_types/custom_cap.yaml',
+                   'custom_types/collectd.yaml'}
+        expected = self._expected(
+            [tpl] + [os.path.join(self.data_dir, f) for f in imports])
+        self.assertEqual(
+            expected,
+            toscaparser.utils.hashutils.hash_all(tpl, imports, 'sha256'))
+
+    def test_hash_all_with_import_dir(self):
+        tpl = os.path.join(self.data_dir, 'test_custom_capabilty.yaml')
+        import_dir = os.path.join(self.data_dir, 'custom_types')
+        paths = [tpl]
+        for root, dirs, files in os.walk(import_dir):
+            paths.extend(os.path.join(root, f) for f in files)
+        self.assertEqual(
+            self._expected(paths),
+            toscaparser.utils.hashutils.hash_all(tpl, import_dir, 'sha256'))
+
+    def test_hash_all_with_thread_pool(self):
+        tpl = os.path.join(self.data_dir, 'test_custom_capabilty.yaml')
+        import_dir = os.path.join(self.data_dir, 'custom_types')
+        hash_all = toscaparser.utils.hashutils.hash_all
+        serial = hash_all(tpl, import_dir, 'sha256')
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.hashutils.POOL_MIN_SIZE', 0))
+        self.assertEqual(serial, hash_all(tpl, import_dir, 'sha256'))
+
+    def _use_fake_blake3(self):
+        FakeBlake3.created = []
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.hashutils.blake3',
+            types.SimpleNamespace(blake3=FakeBlake3)))
+
+    def _check_blake3(self):
+        tpl = os.path.join(self.data_dir, 'test_custom_capabilty.yaml')
+        imports = {'custom_types/custom_cap.yaml',
+                   'custom_types/collectd.yaml'}
+        paths = [tpl] + [os.path.join(self.data_dir, f) for f in imports]
+        # Only custom_cap.yaml (546 bytes) is large enough to be hashed
+        # with BLAKE3's own threads.
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.hashutils.BLAKE3_THREADED_SIZE', 500))
+        expected = 'blake3:' + self._expected(
+            paths, lambda: hashlib.blake2b(digest_size=32))
+
+        hash_all = toscaparser.utils.hashutils.hash_all
+        self.assertEqual(expected, hash_all(tpl, imports, 'blake3'))
+        self.assertEqual(
+            [FakeBlake3.AUTO, 1, 1, 1],
+            sorted(h.max_threads for h in FakeBlake3.created))
+        # 'auto' prefers BLAKE3 when it is installed
+        self.assertEqual(expected, hash_all(tpl, imports))
+
+    def test_hash_all_blake3(self):
+        self._use_fake_blake3()
+        self._check_blake3()
+
+    def test_hash_all_blake3_read_loop(self):
+        self._use_fake_blake3()
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.hashutils.SMALL_FILE_SIZE', 0))
+        self._check_blake3()
+
+    def test_hash_all_blake3_without_file_digest(self):
+        self._use_fake_blake3()
+        if hasattr(hashlib, 'file_digest'):
+            self.useFixture(fixtures.MonkeyPatch(
+                'hashlib.file_digest', fixtures.MonkeyPatch.delete))
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.hashutils.SMALL_FILE_SIZE', 0))
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.hashutils.BLOCKSIZE', 64))
+        self._check_blake3()
+
+    def test_hash_all_blake3_unavailable(self):
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.hashutils.blake3', None))
+        tpl = os.path.join(self.data_dir, 'test_custom_capabilty.yaml')
+        hash_all = toscaparser.utils.hashutils.hash_all
+        self.assertRaises(ValueError, hash_all, tpl, set(), 'blake3')
+        self.assertEqual(hash_all(tpl, set(), 'sha256'),
+                         hash_all(tpl, set()))
+
+    def test_hash_all_unknown_algorithm(self):
+        tpl = os.path.join(self.data_dir, 'test_custom_capabilty.yaml')
+        self.assertRaises(ValueError, toscaparser.utils.hashutils.hash_all,
+                          tpl, set(), 'md5')
+
+
+class ValidateRangeTest(TestCase):
+
+    validateutils = toscaparser.utils.validateutils
+
+    def _collect(self, func, *args):
+        ExceptionCollector.start()
+        func(*args)
+        ExceptionCollector.stop()
+        return ExceptionCollector.getExceptions()
+
+    def test_validate_range_tuple(self):
+        self.assertEqual((1, 10), self.validateutils.validate_range((1, 10)))
+        errors = self._collect(self.validateutils.validate_range, (10, 1))
+        self.assertEqual(1, len(errors))
+        self.assertEqual(_('"(10, 1)" is not a valid range.'),
+                         str(errors[0]))
+
+    def test_validate_value_in_range_tuple(self):
+        in_range = self.validateutils.validate_value_in_range
+        self.assertEqual(5, in_range(5, (1, 10), 'p'))
+        errors = self._collect(in_range, 11, (1, 10), 'p')
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0], RangeValueError)
+
+    def test_validate_value_in_range_unbounded(self):
+        in_range = self.validateutils.validate_value_in_range
+        self.assertEqual(1000, in_range(1000, [1, 'UNBOUNDED'], 'p'))
+        self.assertEqual(-1000, in_range(-1000, ('UNBOUNDED', 1), 'p'))
+        errors = self._collect(in_range, 0, [1, 'UNBOUNDED'], 'p')
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0], RangeValueError)
+
+    def test_invalid_range_reported_on_every_call(self):
+        in_range = self.validateutils.validate_value_in_range
+        for i in range(2):
+            errors = self._collect(in_range, 5, [10, 1], 'p')
+            self.assertEqual(
+                [_('"[10, 1]" is not a valid range.')],
+                [str(e) for e in errors if isinstance(e, ValueError)])
+
+
+class ValidateJsonTest(TestCase):
+
+    validateutils = toscaparser.utils.validateutils
+    schema = {'type': 'object',
+              'properties': {'port': {'type': 'integer'}}}
+
+    def _collect(self, value, schema):
+        ExceptionCollector.start()
+        self.assertEqual(value, self.validateutils.validate_json(value,
+                                                                 schema))
+        ExceptionCollector.stop()
+        return [e.message for e in ExceptionCollector.getExceptions()]
+
+    def test_validate_json_valid(self):
+        self.assertEqual([], self._collect({'port': 80}, self.schema))
+
+    def test_validate_json_invalid_instance(self):
+        self.assertEqual(['Validation instance error'],
+                         self._collect({'port': 'http'}, self.schema))
+
+    def test_validate_json_invalid_schema(self):
+        self.assertEqual(['Validation schema error'],
+                         self._collect({'port': 80}, {'type': 3}))
+
+    def test_validate_json_reuses_validator(self):
+        validator_for = self.validateutils.validator_for
+        calls = []
+
+        def counting_validator_for(schema):
+            calls.append(schema)
+            return validator_for(schema)
+        self.useFixture(fixtures.MonkeyPatch(
+            'toscaparser.utils.validateutils.validator_for',
+            counting_validator_for))
+        schema = dict(self.schema)
+        self.assertEqual([], self._collect({'port': 80}, schema))
+        self.assertEqual(['Validation instance error'],
+                         self._collect({'port': 'http'}, schema))
+        self.assertEqual([schema], calls)
@@ -130,3 +130,17 @@ class TOSCAVersionPropertyTest(TestCase):
         err = self.assertRaises(InvalidTOSCAVersionPropertyException,
                                 TOSCAVersionProperty, version)
         self.assertEqual(exp_msg, err.__str__())
+
+    def test_tosca_version_property_trailing_newline(self):
+
+        version = '18.0\n'
+        exp_msg = _('Value of TOSCA version property "18.0\n" is invalid.')
+        err = self.assertRaises(InvalidTOSCAVersionPropertyException,
+                                TOSCAVersionProperty, version)
+        self.assertEqual(exp_msg, err.__str__())
+
+    def test_tosca_version_re_is_anchored(self):
+
+        self.assertIsNone(TOSCAVersionProperty.VERSION_RE.match('18.0 beta'))
+        match = TOSCAVersionProperty.VERSION_RE.match('18.0.3.beta-1')
+        self.assertEqual('beta', match.group('qualifier'))
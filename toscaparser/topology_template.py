@@ -367,6 +367,7 @@ class TopologyTemplate(object):
             func = functions.get_function(self, self.outputs, output.value)
             if isinstance(func, (functions.GetAttribute, functions.GetProperty)):
                 output.attrs[output.VALUE] = func
+                output.value = func
 
     @classmethod
     def get_sub_mapping_node_type(cls, topology_tpl):
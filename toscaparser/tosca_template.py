@@ -132,6 +132,14 @@ class ToscaTemplate(object):
         return self.template_meta_data.get('service_type')
 
     def _hash(self):
+        """Return a digest of the template file and its imports.
+
+        The algorithm depends on the environment: BLAKE3 is used when the
+        optional blake3 package is installed, SHA-256 otherwise. SHA-256
+        digests are plain hex, as in earlier releases; BLAKE3 digests are
+        returned as "blake3:<hex>". Installing or removing blake3 therefore
+        changes the value, so do not compare keys across environments.
+        """
         return hash_all(self.path, self.imports)
 
     @property
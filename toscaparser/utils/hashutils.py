@@ -10,59 +10,168 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import os
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import hashlib
+import os
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Below this many bytes in total the files are hashed in the calling
+# thread. Starting a pool costs more than hashing a handful of small
+# templates, and hashlib only releases the GIL for larger buffers.
+POOL_MIN_SIZE = 4 * 1024 * 1024
+BLOCKSIZE = 1024 * 1024
+# Files smaller than this are read in one go; a buffered read loop (ours
+# or hashlib.file_digest's 256 KiB one) only pays off for larger files.
+SMALL_FILE_SIZE = 256 * 1024
+# Files at least this large are hashed with BLAKE3's own worker threads.
+BLAKE3_THREADED_SIZE = 4 * 1024 * 1024
+
+ALGORITHMS = (AUTO, SHA256, BLAKE3) = ('auto', 'sha256', 'blake3')
+
+
+def _advise_sequential(f):
+    if hasattr(os, 'posix_fadvise'):
+        # Files are always read front to back; let the kernel read ahead
+        # more aggressively while the previous block is being hashed.
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _hash_file(f, hasher, size):
+    # bytearray() zero-fills, so do not allocate more than the file needs.
+    buf = bytearray(min(BLOCKSIZE, size) or 1)
+    view = memoryview(buf)
+    n = f.readinto(buf)
+    while n:
+        hasher.update(view[:n])
+        n = f.readinto(buf)
+    return hasher.digest()
+
 
+def _hash_one(path, new_hasher):
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < SMALL_FILE_SIZE:
+            hasher = new_hasher(size)
+            hasher.update(f.read())
+            return hasher.digest()
+        _advise_sequential(f)
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the read/update loop runs entirely in C.
+            return hashlib.file_digest(
+                f, functools.partial(new_hasher, size)).digest()
+        return _hash_file(f, new_hasher(size), size)
 
-def hash_bytestr_iter(bytesiter, hasher, ashexstr=False):
-    for block in bytesiter:
-        hasher.update(block)
-    return hasher.hexdigest() if ashexstr else hasher.digest()
 
+def _hasher_factory(algorithm):
+    '''Return the resolved algorithm name and a hasher factory.
 
-def file_as_blockiter(afile, blocksize=65536):
-    with afile:
-        block = afile.read(blocksize)
-        while len(block) > 0:
-            yield block
-            block = afile.read(blocksize)
+    The factory takes the size of the data about to be hashed, which lets
+    BLAKE3 use multiple threads for large files only.
+    '''
+    if algorithm == AUTO:
+        algorithm = BLAKE3 if blake3 is not None else SHA256
+    if algorithm == SHA256:
+        proto = hashlib.sha256()
+        return algorithm, lambda size=0: proto.copy()
+    if algorithm == BLAKE3:
+        if blake3 is None:
+            raise ValueError('Hash algorithm "blake3" requires the blake3 '
+                             'package.')
 
+        def new_blake3(size=0):
+            if size >= BLAKE3_THREADED_SIZE:
+                return blake3.blake3(max_threads=blake3.blake3.AUTO)
+            return blake3.blake3()
+        return algorithm, new_blake3
+    raise ValueError('Unsupported hash algorithm "%s".' % algorithm)
 
-def hash_all(template_path, import_dirs):
 
-    hasher = hashlib.sha256()
-    hashes = list()
-    hashes.append(
-        hash_bytestr_iter(
-            file_as_blockiter(open(template_path, 'rb')), hashlib.sha256()
-        )
-    )
+def _iter_files(root):
+    '''Yield every file below root, like os.walk() without ordering.
 
+    Traversal order does not matter because hash_all() sorts the per-file
+    digests. Symlinked directories are not followed and unreadable
+    directories are skipped, as with os.walk().
+    '''
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield entry.path
+            elif not entry.is_symlink():
+                yield from _iter_files(entry.path)
+
+
+def _use_pool(paths):
+    if len(paths) < 2:
+        return False
+    total = 0
+    for path in paths:
+        try:
+            total += os.stat(path).st_size
+        except OSError:
+            # let the hashing itself report the error
+            continue
+        if total >= POOL_MIN_SIZE:
+            return True
+    return False
+
+
+def _collect_paths(template_path, import_dirs):
+    paths = [template_path]
     template_dir = os.path.dirname(template_path)
     if isinstance(import_dirs, set):
         for _f_name in import_dirs:
-            hashes.append(
-                hash_bytestr_iter(
-                    file_as_blockiter(
-                        open(os.path.normpath(os.path.join(template_dir, _f_name)), 'rb')
-                    ),
-                    hashlib.sha256()
-                )
-            )
+            paths.append(
+                os.path.normpath(os.path.join(template_dir, _f_name)))
+    else:
+        paths.extend(_iter_files(os.fspath(import_dirs)))
+    return paths
+
+
+def hash_all(template_path, import_dirs, algorithm=AUTO):
+    '''Return a hex digest of the template and all of its imports.
+
+    Every file is hashed independently, on a thread pool when there is
+    enough data to make that worthwhile. The per-file digests are then
+    sorted and combined so the result does not depend on the order in
+    which the files were visited.
+
+    algorithm is one of ALGORITHMS; 'auto' picks BLAKE3 when the blake3
+    package is installed and SHA-256 otherwise. SHA-256 digests are
+    returned as plain hex, as before. Other digests are prefixed with the
+    algorithm name, e.g. 'blake3:<hex>', so callers can tell them apart.
+    '''
+    name, new_hasher = _hasher_factory(algorithm)
+    hash_one = functools.partial(_hash_one, new_hasher=new_hasher)
+
+    paths = _collect_paths(template_path, import_dirs)
+    if _use_pool(paths):
+        with ThreadPoolExecutor(
+                max_workers=min(MAX_WORKERS, len(paths))) as executor:
+            hashes = list(executor.map(hash_one, paths))
     else:
-        for root, dirs, files in os.walk(import_dirs, topdown=True):
-            dirs.sort()
-            files.sort()
-            for f_name in files:
-                hashes.append(
-                    hash_bytestr_iter(
-                        file_as_blockiter(
-                            open(os.path.normpath(os.path.join(root, f_name)), 'rb')
-                        ),
-                        hashlib.sha256()
-                    )
-                )
+        hashes = [hash_one(path) for path in paths]
 
+    hasher = new_hasher()
     for val in sorted(hashes):
         hasher.update(val)
-    return hasher.hexdigest()
\ No newline at end of file
+    if name == SHA256:
+        return hasher.hexdigest()
+    return '%s:%s' % (name, hasher.hexdigest())
@@ -10,8 +10,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import collections
+from collections.abc import Mapping as _Mapping
+import datetime
 import dateutil.parser
+import functools
 import logging
 import numbers
 import re
@@ -21,19 +23,39 @@ from toscaparser.common.exception import ExceptionCollector
 from toscaparser.common.exception import InvalidTOSCAVersionPropertyException
 from toscaparser.common.exception import RangeValueError
 from toscaparser.utils.gettextutils import _
-from jsonschema import validate as validate_with_json_schema
+from jsonschema.exceptions import best_match
 from jsonschema.exceptions import ValidationError, SchemaError
+from jsonschema.validators import validator_for
 
 log = logging.getLogger('tosca')
 
 RANGE_UNBOUNDED = 'UNBOUNDED'
 
+# Compiled JSON schema validators keyed by id() of the schema object. The
+# schema itself is kept alongside its validator so the id cannot be reused
+# while the entry exists.
+_JSON_VALIDATORS = {}
+_JSON_VALIDATORS_MAX = 256
+
+_BOOL_STRS = frozenset(('true', 'false'))
+
+# datetime.fromisoformat() is only available on Python 3.7+.
+_HAS_FROMISOFORMAT = hasattr(datetime.datetime, 'fromisoformat')
+_ISO_TIMESTAMP_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+                               r'([T ][0-9]{2}:[0-9]{2}'
+                               r'(:[0-9]{2}(\.[0-9]{3}([0-9]{3})?)?)?'
+                               r'([+-][0-9]{2}:[0-9]{2})?)?')
+
 
 def str_to_num(value):
     '''Convert a string representation of a number into a numeric type.'''
     # TODO(TBD) we should not allow numeric values in, input should be str
     if isinstance(value, numbers.Number):
         return value
+    if isinstance(value, str) and ('.' in value or 'e' in value or
+                                   'E' in value):
+        # int() would reject these anyway; skip the raise and catch.
+        return float(value)
     try:
         return int(value)
     except ValueError:
@@ -48,7 +70,7 @@ def validate_numeric(value):
 
 
 def validate_integer(value):
-    if not isinstance(value, int):
+    if value.__class__ is not int and not isinstance(value, int):
         try:
             value = int(value)
         except Exception:
@@ -58,41 +80,43 @@ def validate_integer(value):
 
 
 def validate_float(value):
-    if not isinstance(value, float):
+    if value.__class__ is not float and not isinstance(value, float):
         ExceptionCollector.appendException(
             ValueError(_('"%s" is not a float.') % value))
     return value
 
 
 def validate_string(value):
-    if not isinstance(value, str):
+    if value.__class__ is not str and not isinstance(value, str):
         ExceptionCollector.appendException(
             ValueError(_('"%s" is not a string.') % value))
     return value
 
 
 def validate_list(value):
-    if not isinstance(value, list):
+    if value.__class__ is not list and not isinstance(value, list):
         ExceptionCollector.appendException(
             ValueError(_('"%s" is not a list.') % value))
     return value
 
 
 def validate_range(range):
-    # list class check
-    validate_list(range)
+    # list class check, tuples are accepted as well
+    if not isinstance(range, tuple):
+        validate_list(range)
     # validate range list has a min and max
     if len(range) != 2:
         ExceptionCollector.appendException(
-            ValueError(_('"%s" is not a valid range.') % range))
+            ValueError(_('"%s" is not a valid range.') % (range,)))
+    lo, hi = range[0], range[1]
     # validate min and max are numerics or the keyword UNBOUNDED
     min_test = max_test = False
-    if not range[0] == RANGE_UNBOUNDED:
-        min = validate_numeric(range[0])
+    if not lo == RANGE_UNBOUNDED:
+        min = validate_numeric(lo)
     else:
         min_test = True
-    if not range[1] == RANGE_UNBOUNDED:
-        max = validate_numeric(range[1])
+    if not hi == RANGE_UNBOUNDED:
+        max = validate_numeric(hi)
     else:
         max_test = True
     # validate the max > min (account for UNBOUNDED)
@@ -100,48 +124,76 @@ def validate_range(range):
         # Note: min == max is allowed
         if min > max:
             ExceptionCollector.appendException(
-                ValueError(_('"%s" is not a valid range.') % range))
+                ValueError(_('"%s" is not a valid range.') % (range,)))
 
     return range
 
 
+@functools.lru_cache(maxsize=256)
+def _is_valid_bounds(lo, hi):
+    lo_unbounded = lo == RANGE_UNBOUNDED
+    hi_unbounded = hi == RANGE_UNBOUNDED
+    if not lo_unbounded and not isinstance(lo, numbers.Number):
+        return False
+    if not hi_unbounded and not isinstance(hi, numbers.Number):
+        return False
+    return lo_unbounded or hi_unbounded or lo <= hi
+
+
+def _is_valid_range(range):
+    if not isinstance(range, (list, tuple)) or len(range) != 2:
+        return False
+    try:
+        return _is_valid_bounds(range[0], range[1])
+    except TypeError:
+        # unhashable bounds are never valid, let validate_range report them
+        return False
+
+
 def validate_value_in_range(value, range, prop_name):
     validate_numeric(value)
-    validate_range(range)
+    # Ranges usually come from type definitions and are checked for every
+    # value; only run the reporting validation when the range is not
+    # already known to be well formed.
+    if not _is_valid_range(range):
+        validate_range(range)
+    lo, hi = range[0], range[1]
 
     # Note: value is valid if equal to min
-    if range[0] != RANGE_UNBOUNDED:
-        if value < range[0]:
+    if lo != RANGE_UNBOUNDED:
+        if value < lo:
             ExceptionCollector.appendException(
                 RangeValueError(pname=prop_name,
                                 pvalue=value,
-                                vmin=range[0],
-                                vmax=range[1]))
+                                vmin=lo,
+                                vmax=hi))
     # Note: value is valid if equal to max
-    if range[1] != RANGE_UNBOUNDED:
-        if value > range[1]:
+    if hi != RANGE_UNBOUNDED:
+        if value > hi:
             ExceptionCollector.appendException(
                 RangeValueError(pname=prop_name,
                                 pvalue=value,
-                                vmin=range[0],
-                                vmax=range[1]))
+                                vmin=lo,
+                                vmax=hi))
     return value
 
 
 def validate_map(value):
-    if not isinstance(value, collections.Mapping):
+    if value.__class__ is dict:
+        return value
+    if not isinstance(value, _Mapping):
         ExceptionCollector.appendException(
             ValueError(_('"%s" is not a map.') % value))
     return value
 
 
 def validate_boolean(value):
-    if isinstance(value, bool):
+    if value.__class__ is bool:
         return value
 
-    if isinstance(value, str):
+    if value.__class__ is str or isinstance(value, str):
         normalised = value.lower()
-        if normalised in ['true', 'false']:
+        if normalised in _BOOL_STRS:
             return normalised == 'true'
 
     ExceptionCollector.appendException(
@@ -149,6 +201,18 @@ def validate_boolean(value):
 
 
 def validate_timestamp(value):
+    # Plain "YYYY-MM-DD[( |T)HH:MM[:SS[.ffffff]]][+HH:MM]" timestamps are
+    # the common case. Both dateutil and every fromisoformat() accept this
+    # shape, and the C parser is far faster. Anything else, including the
+    # extra forms fromisoformat() gained in Python 3.11, goes to dateutil
+    # so the accepted set does not depend on the interpreter.
+    if (_HAS_FROMISOFORMAT and isinstance(value, str) and
+            _ISO_TIMESTAMP_RE.fullmatch(value)):
+        try:
+            datetime.datetime.fromisoformat(value)
+            return
+        except ValueError:
+            pass
     try:
         # Note: we must return our own exception message
         # as dateutil's parser returns different types / values on
@@ -164,9 +228,26 @@ def validate_timestamp(value):
     return
 
 
+def _json_validator(schema):
+    cached = _JSON_VALIDATORS.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    if len(_JSON_VALIDATORS) >= _JSON_VALIDATORS_MAX:
+        _JSON_VALIDATORS.clear()
+    _JSON_VALIDATORS[id(schema)] = (schema, validator)
+    return validator
+
+
 def validate_json(value, schema):
     try:
-        validate_with_json_schema(value, schema)
+        # Same checks as jsonschema.validate(), without re-checking and
+        # rebuilding the validator for every value.
+        error = best_match(_json_validator(schema).iter_errors(value))
+        if error is not None:
+            raise error
     except ValidationError as e:
         ExceptionCollector.appendException(ValidationError(f'Validation instance error', e))
     except SchemaError as e:
@@ -199,20 +280,21 @@ class TOSCAVersionProperty(object):
 
     def __init__(self, version):
         self.version = str(version)
-        match = self.VERSION_RE.match(self.version)
+        # fullmatch() so that '$' cannot match before a trailing newline
+        match = self.VERSION_RE.fullmatch(self.version)
         if not match:
             ExceptionCollector.appendException(
                 InvalidTOSCAVersionPropertyException(what=(self.version)))
             return
-        ver = match.groupdict()
+        (self.major_version, self.minor_version, self.fix_version,
+         qualifier, build_version) = match.group(
+            'major_version', 'minor_version', 'fix_version', 'qualifier',
+            'build_version')
         if self.version in ['0', '0.0', '0.0.0']:
             log.warning('Version assumed as not provided')
             self.version = None
-        self.minor_version = ver['minor_version']
-        self.major_version = ver['major_version']
-        self.fix_version = ver['fix_version']
-        self.qualifier = self._validate_qualifier(ver['qualifier'])
-        self.build_version = self._validate_build(ver['build_version'])
+        self.qualifier = self._validate_qualifier(qualifier)
+        self.build_version = self._validate_build(build_version)
         self._validate_major_version(self.major_version)
 
     def _validate_major_version(self, value):
@@ -28,14 +28,13 @@ else:
 
 
 def load_yaml(path, a_file=True):
-    f = None
     try:
         if a_file:
             f = codecs.open(path, encoding='utf-8', errors='strict')
         else:
             f = urllib.request.urlopen(path)
-        contents = f.read()
-        f.close()
+        with f:
+            contents = f.read()
         return yaml.load(contents, Loader=yaml_loader)
     except urllib.error.URLError as e:
         if hasattr(e, 'reason'):